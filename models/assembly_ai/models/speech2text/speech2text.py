@@ -1,3 +1,5 @@
+import threading
+from collections import OrderedDict
 from typing import IO, Optional
 
 from dify_plugin import Speech2TextModel
@@ -10,6 +12,12 @@ class AssemblyAISpeech2TextModel(Speech2TextModel):
     """
     Model class for OpenAI Speech to text model.
     """
+    # maximum number of (api key, model) transcribers kept alive
+    TRANSCRIBER_CACHE_SIZE = 16
+
+    _transcribers: "OrderedDict[tuple[str, str], aai.Transcriber]" = OrderedDict()
+    _transcribers_lock = threading.Lock()
+
     def _invoke(self, model: str, credentials: dict,
                 file: IO[bytes], user: Optional[str] = None) \
             -> str:
@@ -36,34 +44,74 @@ class AssemblyAISpeech2TextModel(Speech2TextModel):
             audio_file_path = self._get_demo_file_path()
 
             with open(audio_file_path, 'rb') as audio_file:
-                self._speech2text_invoke(model, credentials, audio_file)
+                # don't keep transcribers for keys that may turn out to be invalid
+                self._speech2text_invoke(model, credentials, audio_file, cache_transcriber=False)
         except Exception as ex:
             raise CredentialsValidateFailedError(str(ex))
 
-    def _speech2text_invoke(self, model: str, credentials: dict, file: IO[bytes]) -> str:
+    def _speech2text_invoke(self, model: str, credentials: dict, file: IO[bytes],
+                            cache_transcriber: bool = True) -> str:
         """
         Invoke speech2text model
 
         :param model: model name
         :param credentials: model credentials
         :param file: audio file
+        :param cache_transcriber: whether to reuse a cached transcriber
         :return: text for given audio file
         """
         api_key = credentials.get("api_key")
-        aai.settings.api_key = api_key
-        config = aai.TranscriptionConfig(
-            speech_model=aai.SpeechModel.best if model == "best" else aai.SpeechModel.nano,
-            language_code=aai.LanguageCode.zh,
-        )
-
-        client = aai.Transcriber(config=config)
-        transcript = client.transcribe(file.read())
+        if cache_transcriber:
+            client = self._get_transcriber(model, api_key)
+        else:
+            client = self._create_transcriber(model, api_key)
+        # the SDK uploads file-like objects itself, no need to read them into memory
+        transcript = client.transcribe(file)
 
         if transcript.status == aai.TranscriptStatus.error:
             raise InvokeBadRequestError(transcript.error)
 
         return transcript.text
 
+    def _get_transcriber(self, model: str, api_key: str) -> aai.Transcriber:
+        """
+        Get a transcriber for the given model and api key, reusing it across
+        calls so its HTTP client keeps the connection to AssemblyAI alive
+
+        :param model: model name
+        :param api_key: AssemblyAI api key
+        :return: transcriber
+        """
+        key = (api_key, model)
+        with self._transcribers_lock:
+            transcriber = self._transcribers.get(key)
+            if transcriber is not None:
+                self._transcribers.move_to_end(key)
+                return transcriber
+
+            transcriber = self._create_transcriber(model, api_key)
+            self._transcribers[key] = transcriber
+            if len(self._transcribers) > self.TRANSCRIBER_CACHE_SIZE:
+                self._transcribers.popitem(last=False)
+            return transcriber
+
+    @staticmethod
+    def _create_transcriber(model: str, api_key: str) -> aai.Transcriber:
+        """
+        Create a transcriber for the given model and api key
+
+        :param model: model name
+        :param api_key: AssemblyAI api key
+        :return: transcriber
+        """
+        config = aai.TranscriptionConfig(
+            speech_model=aai.SpeechModel.best if model == "best" else aai.SpeechModel.nano,
+            language_code=aai.LanguageCode.zh,
+        )
+        # a dedicated client avoids mutating the global aai.settings
+        client = aai.Client(settings=aai.Settings(api_key=api_key))
+        return aai.Transcriber(client=client, config=config)
+
     @property
     def _invoke_error_mapping(self) -> dict[type[InvokeError], list[type[Exception]]]:
         """
@@ -1,11 +1,15 @@
 import asyncio
-import copy
-import gzip
-import json
+import functools
+import orjson
+import queue
+import struct
+import threading
 import uuid
 import websockets
-from collections.abc import Generator
-from io import BytesIO
+import websockets.exceptions
+import zlib
+from collections import deque
+from collections.abc import AsyncGenerator, Generator, Sequence
 from typing import Optional
 
 from dify_plugin import TTSModel
@@ -39,6 +43,95 @@ MESSAGE_TYPE_SPECIFIC_FLAGS = {
 }
 MESSAGE_SERIALIZATION_METHODS = {0: "no serialization", 1: "JSON", 15: "custom type"}
 MESSAGE_COMPRESSIONS = {0: "no compression", 1: "gzip", 15: "custom compression method"}
+# payload size, following the header of full client requests
+REQUEST_PAYLOAD_SIZE = struct.Struct(">I")
+# sequence number (signed) + payload size, prefixing audio-only server responses
+AUDIO_RESPONSE_HEADER = struct.Struct(">iI")
+# error code + message size, prefixing error messages from server
+ERROR_RESPONSE_HEADER = struct.Struct(">II")
+# zlib window bits selecting the gzip container
+GZIP_WBITS = 31
+
+
+def _gzip_compress(data: bytes) -> bytes:
+    """
+    Gzip-compress data with zlib directly, skipping the GzipFile machinery
+
+    :param data: data to compress
+    :return: gzip stream bytes
+    """
+    compressor = zlib.compressobj(1, zlib.DEFLATED, GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _parse_frame(response: bytes) -> tuple[bool, Optional[memoryview]]:
+    """
+    Parse a single websocket response frame
+
+    Kept free of instance state and fully typed so the per-frame hot path can be
+    compiled with mypyc if needed.
+
+    :param response: websocket response bytes
+    :return: whether the request is complete, and the audio data of the frame if any
+    """
+    # Parse header
+    message_type = response[1] >> 4
+    message_type_specific_flags = response[1] & 0x0f
+    message_compression = response[2] & 0x0f
+    header_size = response[0] & 0x0f
+    # slice through a view so no per-frame copies are made
+    payload = memoryview(response)[header_size * 4:]
+
+    # Handle audio response
+    if message_type == 0xb:  # audio-only server response
+        if message_type_specific_flags == 0:  # no sequence number as ACK
+            return False, None
+
+        if len(payload) < AUDIO_RESPONSE_HEADER.size:
+            raise InvokeBadRequestError("Truncated audio response from server")
+        sequence_number, _ = AUDIO_RESPONSE_HEADER.unpack_from(payload, 0)
+        audio_data = payload[8:]
+
+        return sequence_number < 0, audio_data
+
+    # Handle error response
+    elif message_type == 0xf:
+        if len(payload) < ERROR_RESPONSE_HEADER.size:
+            raise InvokeBadRequestError("Truncated error message from server")
+        code, _ = ERROR_RESPONSE_HEADER.unpack_from(payload, 0)
+        error_data = bytes(payload[8:])
+        if message_compression == 1:
+            error_data = zlib.decompress(error_data, GZIP_WBITS)
+        error_msg = str(error_data, "utf-8")
+
+        raise InvokeBadRequestError(f"Error code {code}: {error_msg}")
+
+    # Handle frontend response
+    elif message_type == 0xc:
+        # the frontend message carries nothing we use, so it is not decoded
+        return True, None
+
+    return False, None
+
+
+@functools.lru_cache(maxsize=16)
+def _split_sentences(content_text: str, word_limit: int) -> tuple[str, ...]:
+    """
+    Split text into request texts, cached so retries of the same content
+    skip the tokenization
+
+    :param content_text: text content to be translated
+    :param word_limit: maximum length of a single request text
+    :return: request texts in reading order
+    """
+    # the splitter already packs consecutive sentences up to word_limit, but
+    # emits an empty leading group when the first sentence exceeds it
+    return tuple(
+        sentence
+        for sentence in TTSModel._split_text_into_sentences(content_text, max_length=word_limit)
+        if sentence
+    )
+
 
 class VolcengineMaaSTTSModel(TTSModel):
     """
@@ -51,7 +144,17 @@ class VolcengineMaaSTTSModel(TTSModel):
     # message serialization method: b0001 (JSON) (4bits)
     # message compression: b0001 (gzip) (4bits)
     # reserved data: 0x00 (1 byte)
-    DEFAULT_HEADER = bytearray(b'\x11\x10\x11\x00')
+    DEFAULT_HEADER = b'\x11\x10\x11\x00'
+    # same as DEFAULT_HEADER but with message compression: b0000 (none)
+    UNCOMPRESSED_HEADER = b'\x11\x10\x10\x00'
+    # payloads smaller than this are sent uncompressed
+    COMPRESSION_THRESHOLD = 1024
+    # maximum number of websocket connections opened per invocation
+    MAX_CONCURRENT_REQUESTS = 4
+
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_lock = threading.Lock()
+    _voice_cache: dict[str, frozenset[str]] = {}
 
     def _invoke(
         self,
@@ -73,9 +176,7 @@ class VolcengineMaaSTTSModel(TTSModel):
         :param user: unique user id
         :return: text translated to audio file or generator of audio chunks
         """
-        if not voice or voice not in [
-            d["value"] for d in self.get_tts_model_voices(model=model, credentials=credentials)
-        ]:
+        if not voice or voice not in self._voice_set(model, credentials):
             voice = self._get_model_default_voice(model, credentials)
         return self._invoke_streaming(
             model=model,
@@ -85,6 +186,26 @@ class VolcengineMaaSTTSModel(TTSModel):
             user=user
         )
 
+    def _voice_set(self, model: str, credentials: dict) -> frozenset[str]:
+        """
+        Get the available voices of the model, cached per model
+
+        The voices come from the predefined model schema, which does not depend
+        on the credentials, so they are left out of the cache key. The cache is
+        shared by all instances; concurrent misses just compute the same set twice.
+
+        :param model: model name
+        :param credentials: model credentials
+        :return: set of voice values
+        """
+        voices = self._voice_cache.get(model)
+        if voices is None:
+            voices = frozenset(
+                d["value"] for d in self.get_tts_model_voices(model=model, credentials=credentials) or []
+            )
+            self._voice_cache[model] = voices
+        return voices
+
     def validate_credentials(
         self, model: str, credentials: dict, user: Optional[str] = None
     ) -> None:
@@ -96,14 +217,16 @@ class VolcengineMaaSTTSModel(TTSModel):
         :param user: unique user id
         """
         try:
-            self._invoke(
-                model=model,
-                credentials=credentials,
-                content_text="Hello Dify!",
-                voice=self._get_model_default_voice(model, credentials),
-                user=user,
-                tenant_id="",
-            )
+            request = self._build_requests(
+                model,
+                credentials,
+                self._get_model_default_voice(model, credentials),
+                ["Hello Dify!"],
+                user,
+            )[0]
+            asyncio.run_coroutine_threadsafe(
+                self._probe_credentials(request, credentials), self._get_event_loop()
+            ).result()
         except Exception as ex:
             raise CredentialsValidateFailedError(str(ex))
 
@@ -126,12 +249,58 @@ class VolcengineMaaSTTSModel(TTSModel):
         :return: generator of audio chunks
         """
         word_limit = self._get_model_word_limit(model, credentials)
-        audio_type = self._get_model_audio_type(model, credentials)
+        sentences = _split_sentences(content_text, word_limit)
+        requests = self._build_requests(model, credentials, voice, sentences, user)
+
+        loop = self._get_event_loop()
 
-        # Split text into sentences
-        sentences = self._split_text_into_sentences(
-            content_text, max_length=word_limit
+        # (index, chunk) items pushed from the loop thread; a None chunk marks
+        # the end of a request's audio
+        frames = queue.Queue()
+        stream_task = asyncio.run_coroutine_threadsafe(
+            self._stream_all(requests, frames, credentials), loop
         )
+        try:
+            # frames of later requests arrive interleaved, hold them back until
+            # every earlier request has finished
+            held = [deque() for _ in requests]
+            current = 0
+            while current < len(requests):
+                if held[current]:
+                    chunk = held[current].popleft()
+                else:
+                    index, chunk = frames.get()
+                    if index != current:
+                        held[index].append(chunk)
+                        continue
+                if chunk is None:
+                    current += 1
+                    continue
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            stream_task.cancel()
+
+    def _build_requests(
+        self,
+        model: str,
+        credentials: dict,
+        voice: str,
+        sentences: Sequence[str],
+        user: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Build the request payloads for the given sentences
+
+        :param model: model name
+        :param credentials: model credentials
+        :param voice: model timbre
+        :param sentences: request texts in reading order
+        :param user: unique user id
+        :return: request payloads, one per sentence
+        """
+        audio_type = self._get_model_audio_type(model, credentials)
 
         base_request = {
             "app": {
@@ -151,107 +320,217 @@ class VolcengineMaaSTTSModel(TTSModel):
             }
         }
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            for sentence in sentences:
-                request = copy.deepcopy(base_request)
-                request["request"] = {
+        # base_request is never mutated, so a shallow merge is enough
+        return [
+            {
+                **base_request,
+                "request": {
                     "reqid": str(uuid.uuid4()),
                     "text": sentence,
                     "text_type": "plain",
                     "operation": "submit"
                 }
-                
-                chunk = loop.run_until_complete(self._get_audio_data(request, credentials))
-                yield chunk
-        finally:
-            loop.close()
+            }
+            for sentence in sentences
+        ]
 
-    async def _get_audio_data(self, request_json: dict, credentials: dict) -> bytes:
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
         """
-        Get audio data using websocket connection
+        Get the background event loop shared by all instances of this model,
+        starting it on a daemon thread the first time it is needed
+
+        The loop and its thread are never stopped; they live as long as the
+        plugin process.
+
+        :return: running event loop
+        """
+        cls = VolcengineMaaSTTSModel
+        with cls._loop_lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, daemon=True).start()
+                cls._loop = loop
+            return cls._loop
+
+    async def _connect(self, credentials: dict):
+        """
+        Open a websocket connection to the TTS service
 
-        :param request_json: request payload
         :param credentials: model credentials
-        :return: audio bytes
+        :return: connected websocket
         """
         host = credentials.get("api_endpoint_host", "wss://openspeech.bytedance.com")
         api_url = f"{host}/api/v1/tts/ws_binary"
+        headers = {"Authorization": f"Bearer; {credentials['volc_access_key_id']}"}
 
-        # Prepare request payload
-        payload_bytes = str.encode(json.dumps(request_json))
-        payload_bytes = gzip.compress(payload_bytes)
-        
-        # Create full request
-        full_client_request = bytearray(self.DEFAULT_HEADER)
-        full_client_request.extend((len(payload_bytes)).to_bytes(4, 'big'))
-        full_client_request.extend(payload_bytes)
+        return await websockets.connect(api_url, extra_headers=headers, ping_interval=None)
 
-        # Prepare headers
-        headers = {"Authorization": f"Bearer; {credentials['volc_access_key_id']}"}
-        audio_buffer = BytesIO()
+    async def _stream_all(
+        self, requests: list[dict], frames: queue.Queue, credentials: dict
+    ) -> None:
+        """
+        Synthesize all requests over a small pool of persistent connections
+
+        Sentences are independent, so up to MAX_CONCURRENT_REQUESTS workers run
+        in parallel, each reusing its websocket for the requests it picks up for
+        as long as the server keeps it open.
+        Audio frames are pushed to the frame queue as soon as they arrive.
+
+        :param requests: request payloads, one per sentence
+        :param frames: thread-safe queue receiving (request index, audio frame) items
+        :param credentials: model credentials
+        """
+        todo = asyncio.Queue()
+        for index, request in enumerate(requests):
+            todo.put_nowait((index, request))
+        finished = [False] * len(requests)
+
+        async def worker() -> None:
+            ws = None
+            index = None
+            try:
+                while not todo.empty():
+                    index, request = todo.get_nowait()
+                    ws = await self._synthesize(ws, request, index, frames, credentials)
+                    finished[index] = True
+                    index = None
+            except Exception as ex:
+                error = self._to_connection_error(ex)
+                if index is not None:
+                    frames.put_nowait((index, error))
+                    finished[index] = True
+                raise error
+            finally:
+                if ws is not None:
+                    await ws.close()
+
+        workers = min(self.MAX_CONCURRENT_REQUESTS, len(requests))
+        outcomes = await asyncio.gather(
+            *(worker() for _ in range(workers)), return_exceptions=True
+        )
+
+        # Requests left behind because every connection failed
+        error = next((o for o in outcomes if isinstance(o, Exception)), None)
+        for index in range(len(requests)):
+            if not finished[index]:
+                frames.put_nowait(
+                    (index, error or InvokeConnectionError("TTS connection closed unexpectedly"))
+                )
+
+    async def _synthesize(
+        self, ws, request_json: dict, index: int, frames: queue.Queue, credentials: dict
+    ):
+        """
+        Stream the audio of a single request into the frame queue
+
+        The server may close the socket after each synthesis, so a closed
+        websocket is replaced before sending, and a request the server never
+        answered is retried once on a fresh connection.
 
-        async with websockets.connect(api_url, extra_headers=headers, ping_interval=None) as ws:
-            await ws.send(full_client_request)
-            
+        :param ws: websocket connection to reuse, or None
+        :param request_json: request payload
+        :param index: position of the request in reading order
+        :param frames: thread-safe queue receiving (request index, audio frame) items
+        :param credentials: model credentials
+        :return: websocket connection to reuse for the next request
+        """
+        retried = False
+        try:
             while True:
-                response = await ws.recv()
-                done = self._parse_response(response, audio_buffer)
-                if done:
-                    break
+                if ws is None or ws.closed:
+                    if ws is not None:
+                        await ws.close()
+                    ws = await self._connect(credentials)
+
+                received = False
+                try:
+                    await self._send_one(ws, request_json)
+                    async for audio_data in self._stream_audio(ws):
+                        received = True
+                        frames.put_nowait((index, audio_data))
+                except (websockets.exceptions.ConnectionClosed, InvokeConnectionError):
+                    if received or retried:
+                        raise
+                    retried = True
+                    await ws.close()
+                    ws = None
+                    continue
+
+                frames.put_nowait((index, None))
+                return ws
+        except BaseException:
+            # the caller only gets the connection back on success, so close any
+            # connection opened here, including on cancellation
+            if ws is not None:
+                await ws.close()
+            raise
+
+    @staticmethod
+    def _to_connection_error(ex: Exception) -> Exception:
+        """
+        Convert websocket and socket failures into InvokeConnectionError
 
-        return audio_buffer.getvalue()
+        :param ex: exception raised while talking to the server
+        :return: exception to hand to the caller
+        """
+        if isinstance(ex, (websockets.exceptions.WebSocketException, OSError)):
+            return InvokeConnectionError(str(ex))
+        return ex
 
-    def _parse_response(self, response: bytes, audio_buffer: BytesIO) -> bool:
+    async def _probe_credentials(self, request_json: dict, credentials: dict) -> None:
         """
-        Parse websocket response and write audio data to buffer
+        Send a single request and return as soon as the first audio frame
+        arrives, instead of waiting for the whole synthesis to finish
 
-        :param response: websocket response bytes
-        :param audio_buffer: buffer to write audio data
-        :return: True if parsing is complete, False if more data expected
+        :param request_json: request payload
+        :param credentials: model credentials
         """
-        # Parse header
-        message_type = response[1] >> 4
-        message_type_specific_flags = response[1] & 0x0f
-        message_compression = response[2] & 0x0f
-        header_size = response[0] & 0x0f
-        payload = response[header_size * 4:]
-
-        # Handle audio response
-        if message_type == 0xb:  # audio-only server response
-            if message_type_specific_flags == 0:  # no sequence number as ACK
-                return False
-            
-            sequence_number = int.from_bytes(payload[:4], "big", signed=True)
-            payload_size = int.from_bytes(payload[4:8], "big", signed=False)
-            audio_data = payload[8:]
-            
-            audio_buffer.write(audio_data)
-            return sequence_number < 0
-
-        # Handle error response
-        elif message_type == 0xf:
-            code = int.from_bytes(payload[:4], "big", signed=False)
-            msg_size = int.from_bytes(payload[4:8], "big", signed=False)
-            error_msg = payload[8:]
-            
-            if message_compression == 1:
-                error_msg = gzip.decompress(error_msg)
-            error_msg = str(error_msg, "utf-8")
-            
-            raise InvokeBadRequestError(f"Error code {code}: {error_msg}")
-
-        # Handle frontend response
-        elif message_type == 0xc:
-            msg_size = int.from_bytes(payload[:4], "big", signed=False)
-            msg_payload = payload[4:]
-            if message_compression == 1:
-                msg_payload = gzip.decompress(msg_payload)
-            return True
-
-        return False
+        ws = await self._connect(credentials)
+        try:
+            await self._send_one(ws, request_json)
+            frames = self._stream_audio(ws)
+            try:
+                await anext(frames, None)
+            finally:
+                await frames.aclose()
+        finally:
+            await ws.close()
+
+    async def _send_one(self, ws, request_json: dict) -> None:
+        """
+        Send a single framed request on an open websocket
+
+        :param ws: websocket connection
+        :param request_json: request payload
+        """
+        # Prepare request payload
+        payload_bytes = orjson.dumps(request_json)
+        if len(payload_bytes) < self.COMPRESSION_THRESHOLD:
+            header = self.UNCOMPRESSED_HEADER
+        else:
+            header = self.DEFAULT_HEADER
+            payload_bytes = _gzip_compress(payload_bytes)
+
+        # Create full request
+        full_client_request = header + REQUEST_PAYLOAD_SIZE.pack(len(payload_bytes)) + payload_bytes
+
+        await ws.send(full_client_request)
+
+    async def _stream_audio(self, ws) -> AsyncGenerator[bytes, None]:
+        """
+        Receive the audio of a single request from an open websocket
+
+        :param ws: websocket connection
+        :return: async generator of audio frames
+        """
+        async for response in ws:
+            done, audio_data = _parse_frame(response)
+            if audio_data:
+                yield bytes(audio_data)
+            if done:
+                return
+
+        raise InvokeConnectionError("TTS connection closed before the audio was complete")
 
     def _invoke_error_mapping(self) -> dict[type[InvokeError], list[type[Exception]]]:
         """